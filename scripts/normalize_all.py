@@ -1,9 +1,41 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from src.normalize import normalize_text
+from src.normalize import NormalizeStats, normalize_text
+
+
+def _read_text_mmap(path: Path) -> str:
+    """Read a file via mmap: the OS pages it in and we decode exactly once."""
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:  # mmap rejects empty files
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return bytes(mm).decode("utf-8", errors="replace")
+
+
+def _process_file(
+    path: Path,
+    clean_dir: Path,
+    enable_split_word_repair: bool,
+) -> tuple[str, str, NormalizeStats]:
+    """Normalize one raw file; top-level so it can run in a worker process."""
+    raw_text = _read_text_mmap(path)
+    cleaned, stats = normalize_text(
+        raw_text,
+        enable_split_word_repair=enable_split_word_repair,
+    )
+
+    out_path = clean_dir / f"{path.stem}_clean.txt"
+    with out_path.open("w", encoding="utf-8", buffering=1 << 17) as f:
+        f.write(cleaned)
+    return path.name, out_path.name, stats
 
 
 def main() -> None:
@@ -26,17 +58,17 @@ def main() -> None:
         print("No raw .txt files found. (Reminder: data/raw/ is gitignored.)")
         return
 
-    for path in raw_files:
-        raw_text = path.read_text(encoding="utf-8", errors="replace")
-        cleaned, stats = normalize_text(raw_text)
-
-
-        out_path = clean_dir / f"{path.stem}_clean.txt"
-        out_path.write_text(cleaned, encoding="utf-8")
-
-        print(f"\n✅ {path.name} -> {out_path.name}")
-        print(f"  lines_in={stats.lines_in} lines_out={stats.lines_out}")
-        print(f"  merged_lines={stats.merged_lines}")
+    # Files are independent; fan the CPU-bound work out across cores.
+    worker = partial(
+        _process_file,
+        clean_dir=clean_dir,
+        enable_split_word_repair=not args.no_split_repair,
+    )
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for name, out_name, stats in ex.map(worker, raw_files, chunksize=4):
+            print(f"\n✅ {name} -> {out_name}")
+            print(f"  lines_in={stats.lines_in} lines_out={stats.lines_out}")
+            print(f"  merged_lines={stats.merged_lines}")
 
 
 
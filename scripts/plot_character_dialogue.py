@@ -4,6 +4,9 @@ import argparse
 from pathlib import Path
 
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")  # headless: skip GUI backend init
 import matplotlib.pyplot as plt
 
 
@@ -20,27 +23,33 @@ def main() -> None:
     df = pd.read_csv(args.csv)
     df["dialogue_words"] = df["dialogue_words"].astype(int)
 
-    for script_id in sorted(df["script_id"].unique()):
-        sdf = (
-            df[df["script_id"] == script_id]
-            .sort_values("dialogue_words", ascending=False)
-            .head(args.top_n)
-            .copy()
-        )
-
-        plt.figure()
-        plt.barh(sdf["character"], sdf["dialogue_words"])
-        plt.gca().invert_yaxis()
-        plt.xlabel("Dialogue words")
-        plt.title(f"{script_id}: Top {args.top_n} characters by dialogue")
-        plt.tight_layout()
+    # One figure reused across scripts: creating a fresh figure per script
+    # is the dominant fixed cost, clearing the axes is cheap.
+    fig, ax = plt.subplots()
+
+    # One sort + one grouped head() replaces a per-script filter-and-sort of
+    # the whole frame; groupby preserves the descending order within groups.
+    top = (
+        df.sort_values("dialogue_words", ascending=False)
+        .groupby("script_id", sort=True)
+        .head(args.top_n)
+    )
+
+    for script_id, sdf in top.groupby("script_id", sort=True):
+        ax.clear()
+        ax.barh(sdf["character"], sdf["dialogue_words"])
+        ax.invert_yaxis()
+        ax.set_xlabel("Dialogue words")
+        ax.set_title(f"{script_id}: Top {args.top_n} characters by dialogue")
+        fig.tight_layout()
 
         out = out_dir / f"{script_id}_top_characters_dialogue.png"
-        plt.savefig(out, dpi=200)
-        plt.close()
+        fig.savefig(out, dpi=200)
 
         print(f"✅ wrote {out}")
 
+    plt.close(fig)
+
     print(f"\nDone. Images in: {out_dir}")
 
 
@@ -4,6 +4,9 @@ import argparse
 from pathlib import Path
 
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")  # headless: skip GUI backend init
 import matplotlib.pyplot as plt
 
 
@@ -30,13 +33,17 @@ def main() -> None:
     # Keep scenes that have enough words (removes tiny taxi slugs etc.)
     df = df[df["total_words"] >= args.min_total_words].copy()
 
-    df_plot = df[df["scene_heading"] != "NO_SCENE_HEADING"].copy()
+    # One figure reused across scripts: creating a fresh figure per script
+    # is the dominant fixed cost, clearing the axes is cheap.
+    fig, ax = plt.subplots()
 
-    for script_id in sorted(df["script_id"].unique()):
-        sdf = df_plot[df_plot["script_id"] == script_id].sort_values("scene_index").copy()
+    # groupby walks the frame once instead of re-filtering it per script.
+    for script_id, full_sdf in df.sort_values("scene_index").groupby("script_id", sort=True):
+        sdf = full_sdf[full_sdf["scene_heading"] != "NO_SCENE_HEADING"]
 
         if sdf.empty:
-            sdf = df[df["script_id"] == script_id].sort_values("scene_index").copy()
+            sdf = full_sdf
+        sdf = sdf.copy()
 
         # Rolling smoothing (scene-based)
         sdf["rolling_ratio"] = sdf["dialogue_ratio"].rolling(
@@ -44,19 +51,20 @@ def main() -> None:
         ).mean()
 
         # --- Plot 1: dialogue ratio per scene (raw + rolling) ---
-        plt.figure()
-        plt.plot(sdf["scene_index"], sdf["dialogue_ratio"], marker="o")
-        plt.plot(sdf["scene_index"], sdf["rolling_ratio"], marker="o")
-        plt.xlabel("Scene index")
-        plt.ylabel("Dialogue ratio (dialogue_words / total_words)")
-        plt.title(f"{script_id}: Dialogue density by scene")
-        plt.tight_layout()
+        ax.clear()
+        ax.plot(sdf["scene_index"], sdf["dialogue_ratio"], marker="o")
+        ax.plot(sdf["scene_index"], sdf["rolling_ratio"], marker="o")
+        ax.set_xlabel("Scene index")
+        ax.set_ylabel("Dialogue ratio (dialogue_words / total_words)")
+        ax.set_title(f"{script_id}: Dialogue density by scene")
+        fig.tight_layout()
         out1 = out_dir / f"{script_id}_dialogue_density_by_scene.png"
-        plt.savefig(out1, dpi=200)
-        plt.close()
+        fig.savefig(out1, dpi=200)
 
         print(f"✅ wrote {out1}")
 
+    plt.close(fig)
+
     print(f"\nDone. Images in: {out_dir}")
 
 
@@ -1,16 +1,150 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import io
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from .patterns import has_form_feed, is_page_number, is_hard_boundary
 
+try:  # optional: linear-time DFA regex engine, faster on simple alternations
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile with google-re2 when installed, falling back to stdlib re."""
+    # re2's compile does not accept stdlib re flags (its second parameter
+    # is an re2.Options), so bake IGNORECASE — the only flag we use — into
+    # the pattern and hand re2 the pattern alone. Anything else re2 can't
+    # take (unsupported syntax like lookahead, API differences between
+    # re2 versions) degrades to stdlib re rather than failing import.
+    if _re2 is not None:
+        if flags & ~re.IGNORECASE:
+            return re.compile(pattern, flags)
+        re2_pattern = "(?i)" + pattern if flags & re.IGNORECASE else pattern
+        try:
+            return _re2.compile(re2_pattern)
+        except (_re2.error, TypeError, AttributeError, ValueError):
+            pass
+    return re.compile(pattern, flags)
+
+
 INVISIBLE = "\ufeff\u200b\u00a0"
+_INVISIBLE_TBL = str.maketrans("", "", INVISIBLE)
 
 def sanitize_line(s: str) -> str:
     # Remove invisible chars anywhere, and trim ends
-    return s.translate({ord(ch): None for ch in INVISIBLE}).strip()
+    return s.translate(_INVISIBLE_TBL).strip()
+
+
+# -----------------
+# Split-word repair
+# -----------------
+
+# Short words that legitimately stand alone; never glue these to a neighbour.
+_COMMON_SHORT_WORDS = frozenset(
+    {
+        "a", "i", "am", "an", "as", "at", "be", "by", "do", "go", "he",
+        "hi", "if", "in", "is", "it", "me", "my", "no", "of", "oh", "ok",
+        "on", "or", "so", "to", "up", "us", "we", "and", "are", "but",
+        "can", "did", "for", "get", "got", "had", "has", "her", "him",
+        "his", "how", "its", "let", "not", "now", "off", "one", "our",
+        "out", "own", "say", "she", "the", "too", "two", "was", "who",
+        "why", "yes", "you",
+    }
+)
+
+_VOWELS = frozenset("aeiouyAEIOUY")
+
+# Consonant clusters that commonly start English words. A vowel-less
+# fragment in this set followed by a vowel-led word is the head of that word
+# ("sl eeps"), not a tail for the word before it ("man sl").
+_ONSET_CLUSTERS = frozenset(
+    {
+        "bl", "br", "ch", "cl", "cr", "dr", "fl", "fr", "gl", "gr", "ph",
+        "pl", "pr", "sc", "sh", "sk", "sl", "sm", "sn", "sp", "st", "str",
+        "sw", "th", "thr", "tr", "tw", "wh", "wr",
+    }
+)
+
+# Common word-tails that get detached with a vowel still aboard
+# ("Decla re", "slow ly"). Unlike vowel-less fragments these would
+# otherwise pass for legitimate short words.
+_TAIL_FRAGMENTS = frozenset({"re", "ly", "ed", "es", "er", "ing", "tion"})
+
+_NEXT_WORD_START_RE = _compile(r"\s+([A-Za-z])")
+
+# One fused alternation covering all split-word shapes; `re.sub` walks the
+# line once and a single dispatcher picks the branch:
+# - run: a run of 3+ single letters ("s l e p t")
+# - sl:  single letter + fragment ("s lept")
+# - sr:  fragment + single letter ("sai d")
+# - two: two fragments ("sl ept", "fli ght")
+# Only the left fragment (plus whitespace) is consumed; the right fragment is
+# matched by lookahead so chained splits keep repairing left-to-right.
+_SPLIT_WORD_RE = _compile(
+    r"(?P<run>\b(?:[a-z]\s+){2,}[a-z]\b)"
+    r"|(?P<sl>\b[A-Za-z])\s+(?=(?P<sl_r>[A-Za-z]{2,})\b)"
+    r"|(?P<sr>\b[A-Za-z]{2,})\s+(?=(?P<sr_r>[A-Za-z])\b)"
+    r"|(?P<two>\b[A-Za-z]{2,})\s+(?=(?P<two_r>[A-Za-z]{2,})\b)"
+)
+
+
+def repair_split_words_in_line(line: str) -> str:
+    """Repair PDF-extraction split words ("sl ept" -> "slept") in one pass."""
+    # Headings, cues, and transitions carry no lowercase letters and never
+    # contain the split patterns; skip the regex machinery for them.
+    if not any(c.islower() for c in line):
+        return line
+    if " " not in line:
+        return line
+
+    # A fragment that was just glued onto its left neighbour must not also be
+    # glued onto its right neighbour; track how far the last merge reached.
+    merged_until = -1
+
+    def dispatch(m: re.Match[str]) -> str:
+        nonlocal merged_until
+        if m.start() < merged_until:
+            return m.group()
+
+        if m["run"] is not None:
+            return "".join(m["run"].split())
+
+        if m["sl"] is not None:
+            left, right_group = m["sl"], "sl_r"
+        elif m["sr"] is not None:
+            left, right_group = m["sr"], "sr_r"
+        else:
+            left, right_group = m["two"], "two_r"
+            frag = m[right_group]
+            # Conservative: only glue when one side is clearly not a word on
+            # its own ("sl ept", "fli ght"); real word pairs both carry vowels.
+            if not (_VOWELS.isdisjoint(left) or _VOWELS.isdisjoint(frag)):
+                # One exception: a detached word-tail carries a vowel but
+                # still isn't a word ("Decla re" -> "Declare").
+                if frag not in _TAIL_FRAGMENTS:
+                    return m.group()
+            # A vowel-less fragment that plausibly starts the *next* word
+            # belongs to it, not to us ("man sl eeps" -> "man sleeps").
+            elif not _VOWELS.isdisjoint(left):
+                if frag.lower() in _ONSET_CLUSTERS:
+                    nxt = _NEXT_WORD_START_RE.match(m.string, m.end(right_group))
+                    if nxt and nxt.group(1) in _VOWELS:
+                        return m.group()
+
+        right = m[right_group]
+        if not right.islower():
+            return m.group()
+        if left.lower() in _COMMON_SHORT_WORDS or right.lower() in _COMMON_SHORT_WORDS:
+            return m.group()
+
+        merged_until = m.end(right_group)
+        return left
+
+    return _SPLIT_WORD_RE.sub(dispatch, line)
 
 
 @dataclass
@@ -52,6 +186,22 @@ def remove_pdf_artifacts(lines: List[str], stats: NormalizeStats) -> List[str]:
 # Structure injection
 # -----------------
 
+# Compiled once at import; inject_structure_newlines used to recompile all
+# four on every call.
+
+# Beat markers: keep the full marker together
+_BEAT_MARKERS_RE = _compile(r"\b(AND ANOTHER:|ANOTHER MESSAGE:)\s*", re.IGNORECASE)
+
+# Scene heading starters that appear after punctuation/colon/dashes/quotes
+_SCENE_EMB1_RE = _compile(r"([.!?:]|—|-)\s+(INT\.|EXT\.|INT\./EXT\.|I/E)\b", re.IGNORECASE)
+_SCENE_EMB2_RE = _compile(r"([\"\)\]])\s+(INT\.|EXT\.|INT\./EXT\.|I/E)\b", re.IGNORECASE)
+
+# Embedded character cue: punctuation + ALLCAPS cue (1–3 tokens) + space
+_CUE_EMB_RE = _compile(
+    r"([.!?:]|—|-)\s+([A-Z][A-Z'().\-]*(?:\s+[A-Z][A-Z'().\-]*){0,2})\s+"
+)
+
+
 def inject_structure_newlines(lines: List[str], stats: NormalizeStats) -> List[str]:
     """\
     Insert newlines so that (some) screenplay structure tokens land on their own lines.
@@ -64,17 +214,10 @@ def inject_structure_newlines(lines: List[str], stats: NormalizeStats) -> List[s
     Note: this step runs *before* unwrapping so these tokens become hard boundaries.
     """
 
-    # Beat markers: keep the full marker together
-    beat_markers = re.compile(r"\b(AND ANOTHER:|ANOTHER MESSAGE:)\s*", re.IGNORECASE)
-
-    # Scene heading starters that appear after punctuation/colon/dashes/quotes
-    scene_emb1 = re.compile(r"([.!?:]|—|-)\s+(INT\.|EXT\.|INT\./EXT\.|I/E)\b", re.IGNORECASE)
-    scene_emb2 = re.compile(r"([\"\)\]])\s+(INT\.|EXT\.|INT\./EXT\.|I/E)\b", re.IGNORECASE)
-
-    # Embedded character cue: punctuation + ALLCAPS cue (1–3 tokens) + space
-    cue_emb = re.compile(
-        r"([.!?:]|—|-)\s+([A-Z][A-Z'().\-]*(?:\s+[A-Z][A-Z'().\-]*){0,2})\s+"
-    )
+    beat_markers = _BEAT_MARKERS_RE
+    scene_emb1 = _SCENE_EMB1_RE
+    scene_emb2 = _SCENE_EMB2_RE
+    cue_emb = _CUE_EMB_RE
 
     out: List[str] = []
     for ln in lines:
@@ -98,6 +241,9 @@ def inject_structure_newlines(lines: List[str], stats: NormalizeStats) -> List[s
     return out
 
 
+_HEADING_STARTERS = frozenset({"INT.", "EXT.", "INT./EXT.", "I/E"})
+
+
 def merge_scene_heading_chunks(lines: List[str], stats: NormalizeStats) -> List[str]:
     """\
     Merge broken scene headings like:
@@ -112,8 +258,7 @@ def merge_scene_heading_chunks(lines: List[str], stats: NormalizeStats) -> List[
     Stops merging once a time-of-day token is included.
     """
 
-    time_tokens = {"DAY", "NIGHT", "MORNING", "EVENING", "AFTERNOON", "CONTINUOUS"}
-    starters = {"INT.", "EXT.", "INT./EXT.", "I/E"}
+    starters = _HEADING_STARTERS
 
     out: List[str] = []
     i = 0
@@ -134,8 +279,9 @@ def merge_scene_heading_chunks(lines: List[str], stats: NormalizeStats) -> List[
             parts.append(nxt)
             nxt_upper = nxt.upper()
 
-            # stop once we see a time token anywhere on the line
-            if any(tok in nxt_upper.split() for tok in time_tokens) or nxt_upper in time_tokens:
+            # stop once we see a time token anywhere on the line; one hashed
+            # pass over the words instead of one scan per token
+            if not _TIME_SUFFIXES.isdisjoint(nxt_upper.split()):
                 j += 1
                 break
 
@@ -154,6 +300,9 @@ def merge_scene_heading_chunks(lines: List[str], stats: NormalizeStats) -> List[
     return out
 
 
+_TIME_SUFFIXES = frozenset({"DAY", "NIGHT", "MORNING", "EVENING", "AFTERNOON", "CONTINUOUS"})
+
+
 def split_heading_by_time_token(lines: List[str], stats: NormalizeStats) -> List[str]:
     """\
     Force scene headings onto their own line when followed by action text.
@@ -165,27 +314,27 @@ def split_heading_by_time_token(lines: List[str], stats: NormalizeStats) -> List
       Following David...
     """
 
-    time_tokens = [
-        " - DAY",
-        " - NIGHT",
-        " - MORNING",
-        " - EVENING",
-        " - AFTERNOON",
-        " - CONTINUOUS",
-    ]
-
     out: List[str] = []
     for ln in lines:
         s = ln.strip()
         upper = s.upper()
 
         if "INT." in upper or "EXT." in upper or "INT./EXT." in upper or "I/E" in upper:
-            for tok in time_tokens:
-                idx = upper.find(tok)
-                if idx == -1:
-                    continue
-
-                cut = idx + len(tok)
+            # All time tokens share the " - " prefix: one find() locates the
+            # candidate, a set lookup validates the word after it — instead
+            # of six full substring scans per line.
+            cut = -1
+            idx = upper.find(" - ")
+            while idx != -1:
+                start = idx + 3
+                end = upper.find(" ", start)
+                tok = upper[start:] if end == -1 else upper[start:end]
+                if tok in _TIME_SUFFIXES:
+                    cut = start + len(tok)
+                    break
+                idx = upper.find(" - ", start)
+
+            if cut != -1:
                 head = s[:cut].strip()
                 rest = s[cut:].strip()
 
@@ -194,7 +343,6 @@ def split_heading_by_time_token(lines: List[str], stats: NormalizeStats) -> List
                     out.append(rest)
                 else:
                     out.append(head)
-                break
             else:
                 out.append(ln)
         else:
@@ -209,30 +357,31 @@ def split_heading_by_time_token(lines: List[str], stats: NormalizeStats) -> List
 
 def unwrap_within_blocks(lines: List[str], stats: NormalizeStats) -> List[str]:
     out: List[str] = []
+    # Flush is inlined at each boundary and the buffer is reused via
+    # .clear(), keeping one list (and no closure call) for the whole pass.
     buffer: List[str] = []
 
-    def flush():
-        nonlocal buffer
-        if buffer:
-            out.append(_join_buffer(buffer, stats))
-            buffer = []
-
     for ln in lines:
         s = sanitize_line(ln)
 
         if s == "":
-            flush()
+            if buffer:
+                out.append(_join_buffer(buffer, stats))
+                buffer.clear()
             out.append("")
             continue
 
         if is_hard_boundary(s):
-            flush()
+            if buffer:
+                out.append(_join_buffer(buffer, stats))
+                buffer.clear()
             out.append(s)
             continue
 
         buffer.append(s)
 
-    flush()
+    if buffer:
+        out.append(_join_buffer(buffer, stats))
     return out
 
 
@@ -241,29 +390,40 @@ def unwrap_within_blocks(lines: List[str], stats: NormalizeStats) -> List[str]:
 
 def _join_buffer(chunks: List[str], stats: NormalizeStats) -> str:
     """Join lines into a paragraph, preserving hyphen joins."""
-    joined = chunks[0].strip() if chunks else ""
-    for nxt in chunks[1:]:
+    # Interleave separators into one flat list and join once at the end;
+    # repeated `joined + " " + nxt` concatenation is quadratic on long
+    # wrapped paragraphs.
+    parts: List[str] = []
+    merged = 0
+    for nxt in chunks:
         nxt_s = nxt.strip()
         if not nxt_s:
             continue
-        if joined.endswith("-"):
-            joined = joined + nxt_s
+        if parts:
+            if not parts[-1].endswith("-"):
+                parts.append(" ")
+            parts.append(nxt_s)
+            merged += 1
         else:
-            joined = joined + " " + nxt_s
-        stats.merged_lines += 1
-    return joined
+            parts.append(nxt_s)
+    stats.merged_lines += merged
+    return "".join(parts)
 
 
 def collapse_blank_lines(lines: List[str]) -> List[str]:
     """Collapse runs of blank lines to a single blank line."""
     out: List[str] = []
+    append = out.append
     prev_blank = False
     for ln in lines:
-        blank = (ln.strip() == "")
-        if blank and prev_blank:
-            continue
-        out.append("" if blank else ln)
-        prev_blank = blank
+        # `not ln or ln.isspace()` avoids allocating a stripped copy.
+        if not ln or ln.isspace():
+            if not prev_blank:
+                append("")
+            prev_blank = True
+        else:
+            append(ln)
+            prev_blank = False
     return out
 
 
@@ -271,18 +431,72 @@ def collapse_blank_lines(lines: List[str]) -> List[str]:
 # Public API
 # -----------------
 
-def normalize_text(raw_text: str) -> Tuple[str, NormalizeStats]:
-    stats = NormalizeStats()
+def normalize_stream(
+    raw_text: str,
+    stats: NormalizeStats,
+    enable_split_word_repair: bool = True,
+) -> Iterator[str]:
+    """\
+    Yield cleaned lines from a single pass over ``raw_text``.
+
+    Fuses line canonicalization, PDF-artifact removal, split-word repair,
+    blank-line collapsing, and in-block unwrapping into one loop, instead of
+    rebuilding the full list of lines once per step. ``splitlines()`` handles
+    both Unix and Windows line endings in a single C-level split.
+    """
+    buffer: List[str] = []
+    prev_blank = True  # swallow leading blank lines
+
+    # splitlines() also breaks on \f, so form-feed markers never reach the
+    # loop as line content; account for them up front.
+    stats.removed_form_feed_lines += raw_text.count("\f")
+
+    for ln in raw_text.splitlines():
+        stats.lines_in += 1
 
-    lines = canonicalize_lines(raw_text)
-    stats.lines_in = len(lines)
+        s = sanitize_line(ln)
+
+        if not s:
+            if buffer:
+                yield _join_buffer(buffer, stats)
+                buffer = []
+                prev_blank = False
+            if not prev_blank:
+                yield ""
+                prev_blank = True
+            continue
 
-    lines = remove_pdf_artifacts(lines, stats)
+        if is_page_number(s):
+            stats.removed_page_numbers += 1
+            continue
+
+        if is_hard_boundary(s):
+            if buffer:
+                yield _join_buffer(buffer, stats)
+                buffer = []
+            yield s
+            prev_blank = False
+            continue
+
+        if enable_split_word_repair:
+            s = repair_split_words_in_line(s)
+        buffer.append(s)
+        prev_blank = False
+
+    if buffer:
+        yield _join_buffer(buffer, stats)
+
+
+def normalize_text(raw_text: str, enable_split_word_repair: bool = True) -> Tuple[str, NormalizeStats]:
+    stats = NormalizeStats()
 
-    lines = collapse_blank_lines([ln.rstrip() for ln in lines])
+    out = io.StringIO()
+    for ln in normalize_stream(raw_text, stats, enable_split_word_repair):
+        out.write(ln)
+        out.write("\n")
+        stats.lines_out += 1
 
-    stats.lines_out = len(lines)
-    cleaned = "\n".join(lines).strip() + "\n"
+    cleaned = out.getvalue().strip() + "\n"
     return cleaned, stats
 
 
@@ -1,17 +1,87 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
 from .patterns import (
-    is_blank,
-    is_scene_heading,
-    is_character_cue,
+    _is_character_cue_s,
+    _is_scene_heading_s,
+    classify_line,
     strip_character_modifiers,
 )
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with the analysis deps
+    np = None
 
-@dataclass
+# Line-class codes produced by the classification pre-pass; the state
+# machine branches on these small ints instead of re-running predicates.
+LINE_OTHER, LINE_SCENE, LINE_CUE, LINE_BLANK = range(4)
+
+
+@lru_cache(maxsize=8192)
+def _classify_code(s: str) -> int:
+    """
+    Map a stripped line to its LINE_* code.
+
+    Memoized: blank lines and recurring character cues dominate a script,
+    so most lines resolve with a dict hit instead of regex work.
+    """
+    cls = classify_line(s)
+    if cls == "scene":
+        return LINE_SCENE
+    if cls == "blank":
+        return LINE_BLANK
+    # The stripped-input variant skips the no-op re-strip the public
+    # wrapper would do.
+    if _is_character_cue_s(s):
+        return LINE_CUE
+    return LINE_OTHER
+
+
+def _classify_codes(stripped: List[str]) -> List[int]:
+    """
+    Classify a batch of stripped lines into LINE_* codes.
+
+    With numpy available, blank and scene-heading detection run as bulk
+    array operations (one C call per predicate across all lines); only the
+    leftover lines pay for the Python-level cue heuristic. Falls back to
+    the per-line classifier otherwise.
+    """
+    if np is None or len(stripped) < 64:
+        return [_classify_code(s) for s in stripped]
+
+    arr = np.asarray(stripped)
+    upper = np.char.upper(arr)
+    scene = np.char.startswith(upper, "INT.") | np.char.startswith(upper, "EXT.")
+
+    codes = np.zeros(len(stripped), dtype=np.int8)
+    codes[scene] = LINE_SCENE
+
+    # I/E carries a follower-character boundary rule the masks can't
+    # express; candidates are rare, so they go through the shared scalar
+    # predicate rather than a second, diverging definition.
+    for i in np.flatnonzero(np.char.startswith(upper, "I/E")):
+        if _is_scene_heading_s(stripped[i]):
+            codes[i] = LINE_SCENE
+
+    codes[arr == ""] = LINE_BLANK
+
+    # Cue detection keeps its guard stack in Python; run it only on lines
+    # the masks left unclassified.
+    for i in np.flatnonzero(codes == LINE_OTHER):
+        if _is_character_cue_s(stripped[i]):
+            codes[i] = LINE_CUE
+
+    return codes.tolist()
+
+
+# slots=True stores fields in a fixed array instead of a per-instance
+# __dict__ — thousands of Blocks persist for the life of a parse.
+@dataclass(slots=True)
 class Block:
     script_id: str
     scene_index: int
@@ -23,7 +93,7 @@ class Block:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseStats:
     scenes: int = 0
     blocks: int = 0
@@ -31,18 +101,115 @@ class ParseStats:
     action_blocks: int = 0
 
 
+class BlockTable:
+    """
+    Columnar (structure-of-arrays) storage for parsed blocks.
+
+    The parser appends plain values into parallel lists instead of
+    building a Block object per row; column-wise consumers (word-count
+    aggregation, CSV export) read the lists or a DataFrame directly,
+    while indexing materializes a Block lazily so row-wise callers keep
+    working unchanged.
+    """
+
+    __slots__ = (
+        "script_id",
+        "scene_indices",
+        "scene_headings",
+        "block_indices",
+        "block_types",
+        "characters",
+        "texts",
+        "word_counts",
+    )
+
+    def __init__(self, script_id: str):
+        self.script_id = script_id
+        self.scene_indices: List[int] = []
+        self.scene_headings: List[str] = []
+        self.block_indices: List[int] = []
+        self.block_types: List[str] = []
+        self.characters: List[Optional[str]] = []
+        self.texts: List[str] = []
+        self.word_counts: List[int] = []
+
+    def append_row(
+        self,
+        scene_index: int,
+        scene_heading: str,
+        block_index: int,
+        block_type: str,
+        character: Optional[str],
+        text: str,
+        word_count: int,
+    ) -> None:
+        self.scene_indices.append(scene_index)
+        self.scene_headings.append(scene_heading)
+        self.block_indices.append(block_index)
+        self.block_types.append(block_type)
+        self.characters.append(character)
+        self.texts.append(text)
+        self.word_counts.append(word_count)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, i: int) -> Block:
+        return Block(
+            script_id=self.script_id,
+            scene_index=self.scene_indices[i],
+            scene_heading=self.scene_headings[i],
+            block_index=self.block_indices[i],
+            block_type=self.block_types[i],
+            character=self.characters[i],
+            text=self.texts[i],
+            word_count=self.word_counts[i],
+        )
+
+    def __iter__(self):
+        for i in range(len(self.texts)):
+            yield self[i]
+
+    def to_dataframe(self):
+        """
+        Build a pandas DataFrame straight from the column lists — no
+        per-row conversion. Imported lazily so the parser itself stays
+        pandas-free.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "script_id": self.script_id,
+                "scene_index": self.scene_indices,
+                "scene_heading": self.scene_headings,
+                "block_index": self.block_indices,
+                "block_type": self.block_types,
+                "character": self.characters,
+                "text": self.texts,
+                "word_count": self.word_counts,
+            }
+        )
+
+
 def count_words(text: str) -> int:
     """
     Basic token count. You can improve later (e.g., strip punctuation).
     """
-    # TODO: refine tokenization if needed
-    tokens = [t for t in text.split() if t.strip()]
-    return len(tokens)
+    # Fast path: block text is joined from stripped lines with single
+    # spaces, so unless a line carried internal space runs or tabs the
+    # word count is just the separator count plus one — C-level scans
+    # with no token allocation. Otherwise fall back to split().
+    if not text:
+        return 0
+    if "  " not in text and "\t" not in text:
+        return text.count(" ") + 1
+    return len(text.split())
 
 
 def is_parenthetical(line: str) -> bool:
-    s = line.strip()
-    return s.startswith("(") and s.endswith(")") and len(s) >= 2
+    # Callers pass pre-stripped lines; stripping again would be a no-op.
+    return line.startswith("(") and line.endswith(")") and len(line) >= 2
 
 
 class ScriptParser:
@@ -55,7 +222,8 @@ class ScriptParser:
     """
 
     def __init__(self, script_id: str):
-        self.script_id = script_id
+        # Interned: repeated on every exported row/Block of the script.
+        self.script_id = sys.intern(script_id)
         self.seen_first_scene_heading = False
 
         # Current scene state
@@ -68,49 +236,89 @@ class ScriptParser:
         self.buffer_character: Optional[str] = None
         self.buffer_lines: List[str] = []
 
-        # Outputs
-        self.blocks: List[Block] = []
+        # Outputs (columnar; rows materialize lazily on indexing)
+        self.blocks = BlockTable(script_id)
+
+        # When streaming via iter_blocks, completed blocks land here
+        # instead of accumulating in the table.
+        self._pending: Optional[List[Block]] = None
 
         # Stats
         self.stats = ParseStats()
 
-    def parse(self, cleaned_text: str) -> List[Block]:
-        lines = cleaned_text.splitlines()
+    def parse(self, cleaned_text: str) -> BlockTable:
+        # Pre-pass: strip and classify every line up front, then drive the
+        # state machine off the int codes — the hot loop does no regex or
+        # string inspection of its own.
+        stripped = [line.strip() for line in cleaned_text.splitlines()]
+        codes = _classify_codes(stripped)
 
-        for line in lines:
-            self._consume_line(line)
+        # Bind the bound method once: a LOAD_FAST per line instead of
+        # LOAD_FAST + LOAD_ATTR in the hottest loop of the parser.
+        consume = self._consume_line
+        for s, code in zip(stripped, codes):
+            consume(s, code)
 
         # Flush anything left at EOF
         self._flush_buffer()
         self._finalize_stats()
         return self.blocks
 
-    def _consume_line(self, line: str) -> None:
+    def iter_blocks(self, cleaned_text: str):
         """
-        Main state machine.
+        Streaming variant of parse(): yield each Block as it completes
+        instead of accumulating the table, so sequential consumers keep
+        peak memory at O(one block). Stats are complete once the
+        generator is exhausted.
         """
-        if is_scene_heading(line):
+        stripped = [line.strip() for line in cleaned_text.splitlines()]
+        codes = _classify_codes(stripped)
+
+        pending: List[Block] = []
+        self._pending = pending
+        try:
+            consume = self._consume_line
+            for s, code in zip(stripped, codes):
+                consume(s, code)
+                if pending:
+                    yield from pending
+                    pending.clear()
+
+            self._flush_buffer()
+            self._finalize_stats()
+            if pending:
+                yield from pending
+                pending.clear()
+        finally:
+            self._pending = None
+
+    def _consume_line(self, s: str, code: int) -> None:
+        """
+        Main state machine. Takes a stripped line and its LINE_* code from
+        the classification pre-pass.
+        """
+        if code == LINE_SCENE:
             self.seen_first_scene_heading = True
             self._flush_buffer()
-            self._start_new_scene(line)
+            self._start_new_scene(s)
             return
 
 
-        if is_character_cue(line):
+        if code == LINE_CUE:
             # This prevents false "speakers" like the script title from becoming dialogue.
             if not self.seen_first_scene_heading:
                 if self.buffer_type is None:
                     self._start_action_block()
-                self.buffer_lines.append(line.strip())
+                self.buffer_lines.append(s)
                 return
 
             self._flush_buffer()
-            speaker = strip_character_modifiers(line)
+            speaker = strip_character_modifiers(s)
             self._start_dialogue_block(speaker)
             return
 
 
-        if is_blank(line):
+        if code == LINE_BLANK:
             # Blank lines separate blocks
             self._flush_buffer()
             return
@@ -121,16 +329,16 @@ class ScriptParser:
             self._start_action_block()
 
         # Parenthetical handling: attach to dialogue if currently in dialogue
-        if self.buffer_type == "DIALOGUE" and is_parenthetical(line):
+        if self.buffer_type == "DIALOGUE" and is_parenthetical(s):
             # TODO: decide whether to store parentheticals separately; v1 appends
-            self.buffer_lines.append(line.strip())
+            self.buffer_lines.append(s)
             return
 
-        self.buffer_lines.append(line.strip())
+        self.buffer_lines.append(s)
 
     def _start_new_scene(self, heading_line: str) -> None:
         self.scene_index += 1
-        self.scene_heading = heading_line.strip()
+        self.scene_heading = heading_line
         self.stats.scenes = self.scene_index + 1
 
         # Reset per-scene block index
@@ -142,8 +350,12 @@ class ScriptParser:
             self._start_new_scene("NO_SCENE_HEADING")
 
         self.buffer_type = "DIALOGUE"
-        self.buffer_character = speaker
-        self.buffer_lines = []
+        # A script has thousands of dialogue blocks but only ~dozens of
+        # speakers; interning stores each name once and makes downstream
+        # equality checks pointer comparisons. (block_type needs no such
+        # treatment: the "ACTION"/"DIALOGUE" literals are already shared.)
+        self.buffer_character = sys.intern(speaker)
+        self.buffer_lines.clear()
 
     def _start_action_block(self) -> None:
         if self.scene_index < 0:
@@ -151,30 +363,45 @@ class ScriptParser:
 
         self.buffer_type = "ACTION"
         self.buffer_character = None
-        self.buffer_lines = []
+        self.buffer_lines.clear()
 
     def _flush_buffer(self) -> None:
         if not self.buffer_type or not self.buffer_lines:
             # Reset buffer cleanly
             self.buffer_type = None
             self.buffer_character = None
-            self.buffer_lines = []
+            self.buffer_lines.clear()
             return
 
-        text = " ".join([ln for ln in self.buffer_lines if ln])
+        # Lines are stripped and blank lines never reach the buffer, so the
+        # join needs no filtering pass.
+        text = " ".join(self.buffer_lines)
         wc = count_words(text)
 
-        block = Block(
-            script_id=self.script_id,
-            scene_index=self.scene_index,
-            scene_heading=self.scene_heading,
-            block_index=self.block_index,
-            block_type=self.buffer_type,
-            character=self.buffer_character if self.buffer_type == "DIALOGUE" else None,
-            text=text,
-            word_count=wc,
-        )
-        self.blocks.append(block)
+        character = self.buffer_character if self.buffer_type == "DIALOGUE" else None
+        if self._pending is not None:
+            self._pending.append(
+                Block(
+                    script_id=self.script_id,
+                    scene_index=self.scene_index,
+                    scene_heading=self.scene_heading,
+                    block_index=self.block_index,
+                    block_type=self.buffer_type,
+                    character=character,
+                    text=text,
+                    word_count=wc,
+                )
+            )
+        else:
+            self.blocks.append_row(
+                scene_index=self.scene_index,
+                scene_heading=self.scene_heading,
+                block_index=self.block_index,
+                block_type=self.buffer_type,
+                character=character,
+                text=text,
+                word_count=wc,
+            )
 
         # Update stats / indices
         self.stats.blocks += 1
@@ -185,10 +412,10 @@ class ScriptParser:
 
         self.block_index += 1
 
-        # Reset buffer
+        # Reset buffer (clear, not rebind, to keep the list's capacity warm)
         self.buffer_type = None
         self.buffer_character = None
-        self.buffer_lines = []
+        self.buffer_lines.clear()
 
     def _finalize_stats(self) -> None:
         # Nothing special yet; placeholder for future stats checks
@@ -197,8 +424,16 @@ class ScriptParser:
 
 def parse_script(cleaned_text: str, script_id: str) -> Dict[str, Any]:
     """
-    Convenience wrapper returning both blocks and stats.
+    Convenience wrapper returning both blocks and stats (eager form).
     """
     parser = ScriptParser(script_id=script_id)
     blocks = parser.parse(cleaned_text)
     return {"blocks": blocks, "stats": parser.stats}
+
+
+def iter_script_blocks(cleaned_text: str, script_id: str):
+    """
+    Streaming counterpart to parse_script: yields Blocks one at a time.
+    """
+    parser = ScriptParser(script_id=script_id)
+    yield from parser.iter_blocks(cleaned_text)
@@ -2,23 +2,45 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
-SCENE_HEADING_RE = re.compile(r"^\s*(INT\.|EXT\.|INT\./EXT\.|I/E)\b", re.IGNORECASE)
-PAGE_NUMBER_RE = re.compile(r"^\s*\d+\s*$")
-FORM_FEED_RE = re.compile(r"[\f]") # form feed character
+# The one scene-heading boundary rule: a heading starts with "INT." or
+# "EXT." (the period ends the prefix by itself), or "I/E" followed by the
+# end of the line or any character outside [A-Z0-9]. Every scene check in
+# this module — regex or prefix-based — derives from this alternation so
+# they cannot drift apart.
+_SCENE_ALT = r"INT\.|EXT\.|I/E(?![A-Z0-9])"
 
+SCENE_HEADING_RE = re.compile(r"^\s*(" + _SCENE_ALT + r")", re.IGNORECASE)
 # Transition cues:
 TRANSITION_RE = re.compile(r"^\s*[A-Z0-9 '().-]+TO:\s*$")
 
-# Candidate character cues:
-# - mostly uppercase
-# - short
-# - may include modifiers like (O.S.), (PRE-LAP)
-CHAR_CUE_ALLOWED_RE = re.compile(r"^[A-Z0-9 '().\-]+$")
+# One alternation classifies a line in a single C-level match instead of
+# dispatching 3-4 separate patterns from Python. Scene prefixes keep their
+# case-insensitivity via a local (?i:...) group; transitions stay
+# uppercase-only, matching TRANSITION_RE.
+LINE_CLASS_RE = re.compile(
+    r"^(?:"
+    r"(?P<scene>\s*(?i:" + _SCENE_ALT + r"))"
+    r"|(?P<page>\s*\d+\s*$)"
+    r"|(?P<trans>\s*[A-Z0-9 '().\-]+TO:\s*$)"
+    r"|(?P<blank>\s*$)"
+    r")"
+)
+
+# Combined cue pattern: allowed charset, 1-30 chars, and a negative
+# lookahead that rejects scene headings — one regex pass instead of
+# separate scene/charset/length checks.
+CHAR_CUE_RE = re.compile(r"^(?!" + _SCENE_ALT + r")[A-Z0-9 '().\-]{1,30}$")
+
+_TOD_SUFFIXES = ("DAY", "NIGHT", "MORNING", "EVENING", "AFTERNOON")
 
+# Canonical blocklist of beat markers, times of day, and other non-speaker
+# tokens that appear as standalone uppercase lines.
 CHAR_CUE_BLOCKLIST = frozenset(
     {
         "AFTERNOON",
+        "CONTINUOUS",
         "DAWN",
         "DAY",
         "DUSK",
@@ -29,9 +51,11 @@ CHAR_CUE_BLOCKLIST = frozenset(
         "MORNING",
         "NIGHT",
         "NOON",
+        "SAME",
         "SAME TIME",
         "SUNRISE",
         "SUNSET",
+        "TITLE",
     }
 )
 
@@ -43,24 +67,71 @@ class BoundaryFlags:
     is_transition: bool
 
 
+# Bound method references: calling these skips the LOAD_GLOBAL + LOAD_ATTR
+# pair that `PATTERN.match(...)` pays on every call in the hot predicates.
+_LINE_CLASS_MATCH = LINE_CLASS_RE.match
+_SCENE_MATCH = SCENE_HEADING_RE.match
+_TRANSITION_MATCH = TRANSITION_RE.match
+_CHAR_CUE_MATCH = CHAR_CUE_RE.match
+
+
+def classify_line(line: str) -> str:
+    """
+    Classify a line as "scene", "page", "trans", "blank", or "other" with a
+    single match against LINE_CLASS_RE.
+    """
+    m = _LINE_CLASS_MATCH(line)
+    return m.lastgroup if m else "other"
+
+
 def is_blank(line: str) -> bool:
     return line.strip() == ""
 
 
 def is_page_number(line: str) -> bool:
-    return PAGE_NUMBER_RE.match(line) is not None
+    # "digits only, maybe padded" needs no regex: one C-level scan.
+    s = line.strip()
+    return bool(s) and s.isdigit()
 
 
 def has_form_feed(line: str) -> bool:
-    return FORM_FEED_RE.search(line) is not None
+    return "\f" in line
+
+
+# Prefixes whose fourth character already closes the match under the
+# boundary rule above; str.startswith with a tuple is a short C-level scan,
+# cheaper than running the regex engine.
+_SCENE_PREFIXES = ("INT.", "EXT.")
 
 
 def is_scene_heading(line: str) -> bool:
-    return SCENE_HEADING_RE.match(line) is not None
+    return _is_scene_heading_s(line.lstrip())
 
 
 def is_transition(line: str) -> bool:
-    return TRANSITION_RE.match(line.strip()) is not None
+    return _is_transition_s(line.strip())
+
+
+# Variants taking already-stripped input, for callers (the parser hot loop)
+# that strip each line exactly once up front.
+
+def _is_scene_heading_s(s: str) -> bool:
+    u = s[:4].upper()
+    if u.startswith(_SCENE_PREFIXES):
+        return True
+    if not u.startswith("I/E"):
+        return False
+    # Same follower rule as the (?![A-Z0-9]) lookahead in _SCENE_ALT.
+    c = u[3:4]
+    return not c or not ("A" <= c <= "Z" or "0" <= c <= "9")
+
+
+def _is_transition_s(s: str) -> bool:
+    # Almost no lines end in "TO:"; the suffix test screens them out
+    # before the regex verifies the allowed charset.
+    if not s.endswith("TO:"):
+        return False
+    return _TRANSITION_MATCH(s) is not None
 
 
 def is_character_cue(line: str) -> bool:
@@ -72,55 +143,37 @@ def is_character_cue(line: str) -> bool:
     - not a transition
     - not common beat markers (LATER, CONTINUOUS, etc.)
     """
-    s = line.strip()
+    return _is_character_cue_s(line.strip())
+
+
+def _is_character_cue_s(s: str) -> bool:
     if not s:
         return False
 
-    # Hard exclusions
-    if is_scene_heading(s) or is_transition(s):
+    # One regex traversal covers the charset, the 30-char cap, and the
+    # scene-heading exclusion; the matched string is uppercase-only, so no
+    # separate s.upper() copy is needed for the guards below.
+    if _CHAR_CUE_MATCH(s) is None:
         return False
 
-    # If it looks like a scene heading even with weird spacing, bail out.
-    upper = s.upper()
-    if upper.startswith("INT.") or upper.startswith("EXT.") or upper.startswith("INT./EXT.") or upper.startswith("I/E"):
+    # Transitions ("CUT TO:", "SMASH CUT TO:") share the cue charset
+    if s.endswith("TO:"):
         return False
 
-    if CHAR_CUE_ALLOWED_RE.match(s) is None:
+    # Too many words to be a cue
+    if s.count(" ") > 3:
         return False
 
-    words = s.split()
-
-    # Too long to be a cue
-    if len(words) > 4:
-        return False
-    if len(s) > 30:
-        return False
-
-    # Beat markers and common non-speaker tokens that appear as standalone lines
-    blocklist = {
-        "LATER",
-        "MOMENTS LATER",
-        "CONTINUOUS",
-        "SAME",
-        "MORNING",
-        "NIGHT",
-        "DAY",
-        "EVENING",
-        "AFTERNOON",
-        "TITLE",
-    }
-    if upper in blocklist:
+    if s in CHAR_CUE_BLOCKLIST:
         return False
 
     # Title-page / credit lines sometimes come in uppercase; avoid common patterns
-    if "BY " in upper:
+    if "BY " in s:
         return False
 
     # Another guard: cues rarely contain hyphens used like scene headings (" - DAY")
-    if " - " in s:
-        tod = ("DAY", "NIGHT", "MORNING", "EVENING", "AFTERNOON")
-        if upper.endswith(tod):
-            return False
+    if " - " in s and s.endswith(_TOD_SUFFIXES):
+        return False
 
     return True
 
@@ -131,21 +184,29 @@ def strip_character_modifiers(cue_line: str) -> str:
     Convert: 'FLETCHER (PRE-LAP)' -> 'FLETCHER'
     Convert: 'JIM (O.S.)' -> 'JIM'
     """
-    s = cue_line.strip()
-    # Split off anything starting at first ' (' or '('
-    base = re.split(r"\s*\(", s, maxsplit=1)[0]
-    return base.strip()
+    # Cut at the first '(' with a single C-level scan; rstrip eats the
+    # space that preceded it. No regex needed.
+    return cue_line.strip().partition("(")[0].rstrip()
 
 
+@lru_cache(maxsize=8192)
 def boundary_flags(line: str) -> BoundaryFlags:
     """
     Convenience: classify boundaries in one place.
+
+    Strips the line once and runs every predicate on the stripped string
+    (stripping an already-stripped line is a no-op returning the same
+    object, so callers that pre-strip pay nothing extra). Results are
+    memoized: scripts repeat blank lines, beat markers, and the same
+    handful of character cues constantly, so hits skip the predicates
+    entirely; BoundaryFlags is frozen, so sharing instances is safe.
     """
+    s = line.strip()
     return BoundaryFlags(
-        is_blank=is_blank(line),
-        is_scene_heading=is_scene_heading(line),
-        is_character_cue=is_character_cue(line),
-        is_transition=is_transition(line),
+        is_blank=not s,
+        is_scene_heading=_is_scene_heading_s(s),
+        is_character_cue=_is_character_cue_s(s),
+        is_transition=_is_transition_s(s),
     )
 
 
@@ -1,7 +1,7 @@
 # tests/test_normalize.py
 from __future__ import annotations
 
-from src.normalize import normalize_text
+from src.normalize import normalize_text, repair_split_words_in_line
 
 
 def test_removes_page_numbers_and_form_feed():
@@ -51,3 +51,14 @@ def test_hyphen_join():
     )
     cleaned, _ = normalize_text(raw, enable_split_word_repair=False)
     assert "our guy-Benji points" in cleaned
+
+
+def test_repairs_split_words_including_detached_tails():
+    # Vowel-less fragments ("sl ept") and detached word-tails ("Decla re")
+    assert repair_split_words_in_line("He sl ept all day.") == "He slept all day."
+    assert repair_split_words_in_line("Decla re your intent.") == "Declare your intent."
+    assert repair_split_words_in_line("He walked slow ly away.") == "He walked slowly away."
+
+    # Legitimate word pairs stay apart
+    assert repair_split_words_in_line("We are here.") == "We are here."
+    assert repair_split_words_in_line("my pet dog barks") == "my pet dog barks"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from src.parser import parse_script
+from src.patterns import strip_character_modifiers
 
 
 def test_parses_scene_heading_action_and_dialogue_blocks():
@@ -43,3 +44,10 @@ def test_character_modifiers_are_stripped():
     blocks = result["blocks"]
     assert len(blocks) == 1
     assert blocks[0].character == "FLETCHER"
+
+
+def test_strip_character_modifiers():
+    assert strip_character_modifiers("FLETCHER (PRE-LAP)") == "FLETCHER"
+    assert strip_character_modifiers("JIM (O.S.)") == "JIM"
+    assert strip_character_modifiers("  ALEX (V.O.) ") == "ALEX"
+    assert strip_character_modifiers("JAMIE") == "JAMIE"